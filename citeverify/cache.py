@@ -4,11 +4,31 @@ import sqlite3
 import json
 import hashlib
 import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
-from datetime import datetime, timedelta
 from .models import VerificationResult, VerificationStatus
 
+# Bump when the table layout changes; old caches are dropped and rebuilt
+_SCHEMA_VERSION = 3
+
+try:
+    # orjson is several times faster than stdlib json for the nested
+    # result dicts we serialize on every cache write
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+    _loads = json.loads
+
 
 class VerificationCache:
     """Cache verification results in SQLite database."""
@@ -34,30 +54,72 @@ class VerificationCache:
         Path(cache_dir).mkdir(parents=True, exist_ok=True)
         self.db_path = os.path.join(cache_dir, "cache.db")
         self.ttl_days = ttl_days
+        self._ttl_seconds = ttl_days * 86400
+        # One long-lived connection: opening the DB per call re-reads the
+        # WAL header and schema on every get/set in the verification loop.
+        self._conn = sqlite3.connect(self.db_path)
+        self._apply_pragmas(self._conn)
+        self._defer_commit = False
+        # In-memory layer: papers cite the same DOI/title repeatedly, so
+        # duplicate lookups within a run skip SQLite entirely. Holds
+        # VerificationResults and raw payloads alike, keyed by query hash.
+        self._mem: OrderedDict = OrderedDict()
         self._init_db()
 
     def _init_db(self):
-        """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS verification_cache (
-                    cache_key TEXT PRIMARY KEY,
-                    result_json TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    query_type TEXT,
-                    query_value TEXT
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_created_at 
-                ON verification_cache(created_at)
-            """)
-            conn.commit()
+        """Initialize database schema, migrating old caches by recreation."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            # Cache contents are disposable; recreate rather than migrate
+            self._conn.execute("DROP TABLE IF EXISTS verification_cache")
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS verification_cache (
+                cache_key TEXT PRIMARY KEY,
+                result_json TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                query_type TEXT,
+                query_value TEXT
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_created_at
+            ON verification_cache(created_at)
+        """)
+        # Covering index so stats() group-by and freshness filters are
+        # satisfied from index order without scanning the table
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_qtype_created
+            ON verification_cache(query_type, created_at)
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection) -> None:
+        """Tune SQLite for a write-heavy local cache.
+
+        WAL + NORMAL synchronous avoids an fsync per write, and the larger
+        page cache / mmap keep reads off disk. journal_mode is persistent,
+        but re-applying the pragmas on open is cheap.
+        """
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+
+    def _cutoff_epoch(self) -> int:
+        """Oldest created_at (unix seconds) still considered fresh."""
+        return int(time.time()) - self._ttl_seconds
 
     def _make_key(self, query_type: str, query_value: str) -> str:
         """Create cache key from query type and value."""
-        key_str = f"{query_type}:{query_value.lower().strip()}"
-        return hashlib.sha256(key_str.encode()).hexdigest()[:32]
+        # Truncate to match what set() stores, and to bound the hash cost
+        # for pathologically long values
+        key_str = f"{query_type}:{query_value.lower().strip()[:500]}"
+        # BLAKE2s at digest_size=16 yields the same 32-hex-char key as the
+        # old truncated SHA-256, but is much cheaper per call
+        return hashlib.blake2s(key_str.encode(), digest_size=16).hexdigest()
 
     def get(self, query_type: str, query_value: str) -> Optional[VerificationResult]:
         """
@@ -71,23 +133,30 @@ class VerificationCache:
             VerificationResult if found and not expired, None otherwise
         """
         cache_key = self._make_key(query_type, query_value)
-        cutoff = datetime.now() - timedelta(days=self.ttl_days)
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT result_json, created_at FROM verification_cache
-                WHERE cache_key = ? AND created_at > ?
-                """,
-                (cache_key, cutoff.isoformat()),
-            )
-            row = cursor.fetchone()
-
-            if row:
-                result_data = json.loads(row[0])
-                # Convert status string back to enum
-                result_data["status"] = VerificationStatus(result_data["status"])
-                return VerificationResult(**result_data)
+
+        cached = self._mem.get(cache_key)
+        if cached is not None:
+            self._mem.move_to_end(cache_key)
+            return cached
+
+        cutoff = self._cutoff_epoch()
+
+        cursor = self._conn.execute(
+            """
+            SELECT result_json, created_at FROM verification_cache
+            WHERE cache_key = ? AND created_at > ?
+            """,
+            (cache_key, cutoff),
+        )
+        row = cursor.fetchone()
+
+        if row:
+            result_data = _loads(row[0])
+            # Convert status string back to enum
+            result_data["status"] = VerificationStatus(result_data["status"])
+            result = VerificationResult(**result_data)
+            self._remember(cache_key, result)
+            return result
 
         return None
 
@@ -103,28 +172,108 @@ class VerificationCache:
             result: VerificationResult to cache
         """
         cache_key = self._make_key(query_type, query_value)
+        self._remember(cache_key, result)
 
         # Convert result to JSON-serializable dict
         result_dict = result.model_dump()
         result_dict["status"] = result_dict["status"].value  # Convert enum to string
-        result_json = json.dumps(result_dict, default=str)
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO verification_cache 
-                (cache_key, result_json, created_at, query_type, query_value)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    cache_key,
-                    result_json,
-                    datetime.now().isoformat(),
-                    query_type,
-                    query_value[:500],  # Truncate long values
-                ),
-            )
-            conn.commit()
+        result_json = _dumps(result_dict)
+
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO verification_cache
+            (cache_key, result_json, created_at, query_type, query_value)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                cache_key,
+                result_json,
+                int(time.time()),
+                query_type,
+                query_value[:500],  # Truncate long values
+            ),
+        )
+        if not self._defer_commit:
+            self._conn.commit()
+
+    def get_payload(self, query_type: str, query_value: str) -> Optional[dict]:
+        """
+        Get a cached raw API payload (parsed JSON).
+
+        Same storage and TTL as verification results, but the value is
+        returned as-is instead of being rebuilt into a VerificationResult.
+        Use a distinct query_type (e.g. 'http') so the namespaces don't mix.
+
+        Returns:
+            The cached payload if found and not expired, None otherwise
+        """
+        cache_key = self._make_key(query_type, query_value)
+
+        cached = self._mem.get(cache_key)
+        if cached is not None:
+            self._mem.move_to_end(cache_key)
+            return cached
+
+        cursor = self._conn.execute(
+            """
+            SELECT result_json FROM verification_cache
+            WHERE cache_key = ? AND created_at > ?
+            """,
+            (cache_key, self._cutoff_epoch()),
+        )
+        row = cursor.fetchone()
+
+        if row:
+            payload = _loads(row[0])
+            self._remember(cache_key, payload)
+            return payload
+
+        return None
+
+    def set_payload(self, query_type: str, query_value: str, payload: dict) -> None:
+        """Store a raw API payload (any JSON-serializable value)."""
+        cache_key = self._make_key(query_type, query_value)
+        self._remember(cache_key, payload)
+
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO verification_cache
+            (cache_key, result_json, created_at, query_type, query_value)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                cache_key,
+                _dumps(payload),
+                int(time.time()),
+                query_type,
+                query_value[:500],
+            ),
+        )
+        if not self._defer_commit:
+            self._conn.commit()
+
+    def _remember(self, cache_key: str, result) -> None:
+        """Store a result (or raw payload) in the bounded in-memory layer."""
+        self._mem[cache_key] = result
+        self._mem.move_to_end(cache_key)
+        while len(self._mem) > 4096:
+            self._mem.popitem(last=False)
+
+    @contextmanager
+    def bulk_writes(self):
+        """
+        Batch set() calls into a single transaction.
+
+        Inside this context, set() skips its per-call commit; everything is
+        committed once on exit. Use around the verification loop so N cache
+        writes cost one WAL commit instead of N.
+        """
+        self._defer_commit = True
+        try:
+            yield self
+            self._conn.commit()
+        finally:
+            self._defer_commit = False
 
     def clear(self) -> int:
         """
@@ -133,12 +282,10 @@ class VerificationCache:
         Returns:
             Number of entries cleared
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM verification_cache")
-            count = cursor.fetchone()[0]
-            conn.execute("DELETE FROM verification_cache")
-            conn.commit()
-            return count
+        self._mem.clear()
+        cursor = self._conn.execute("DELETE FROM verification_cache")
+        self._conn.commit()
+        return cursor.rowcount
 
     def clear_expired(self) -> int:
         """
@@ -147,20 +294,12 @@ class VerificationCache:
         Returns:
             Number of entries cleared
         """
-        cutoff = datetime.now() - timedelta(days=self.ttl_days)
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM verification_cache WHERE created_at <= ?",
-                (cutoff.isoformat(),),
-            )
-            count = cursor.fetchone()[0]
-            conn.execute(
-                "DELETE FROM verification_cache WHERE created_at <= ?",
-                (cutoff.isoformat(),),
-            )
-            conn.commit()
-            return count
+        cursor = self._conn.execute(
+            "DELETE FROM verification_cache WHERE created_at <= ?",
+            (self._cutoff_epoch(),),
+        )
+        self._conn.commit()
+        return cursor.rowcount
 
     def stats(self) -> dict:
         """
@@ -169,24 +308,22 @@ class VerificationCache:
         Returns:
             Dictionary with cache stats
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM verification_cache")
-            total = cursor.fetchone()[0]
-
-            cutoff = datetime.now() - timedelta(days=self.ttl_days)
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM verification_cache WHERE created_at > ?",
-                (cutoff.isoformat(),),
-            )
-            valid = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """
-                SELECT query_type, COUNT(*) FROM verification_cache 
-                GROUP BY query_type
-                """
-            )
-            by_type = dict(cursor.fetchall())
+        cursor = self._conn.execute("SELECT COUNT(*) FROM verification_cache")
+        total = cursor.fetchone()[0]
+
+        cursor = self._conn.execute(
+            "SELECT COUNT(*) FROM verification_cache WHERE created_at > ?",
+            (self._cutoff_epoch(),),
+        )
+        valid = cursor.fetchone()[0]
+
+        cursor = self._conn.execute(
+            """
+            SELECT query_type, COUNT(*) FROM verification_cache
+            GROUP BY query_type
+            """
+        )
+        by_type = dict(cursor.fetchall())
 
         return {
             "total_entries": total,
@@ -196,3 +333,20 @@ class VerificationCache:
             "db_path": self.db_path,
             "ttl_days": self.ttl_days,
         }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+# Process-wide default cache so the CLI, verifier, and stats path share one
+# connection instead of re-running _init_db per construction
+_default_cache: Optional[VerificationCache] = None
+
+
+def get_cache() -> VerificationCache:
+    """Return the shared default VerificationCache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = VerificationCache()
+    return _default_cache
@@ -2,6 +2,7 @@
 
 import asyncio
 import re
+from contextlib import nullcontext
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,10 +10,13 @@ import time
 from pathlib import Path
 from typing import List
 
+import aiohttp
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
+from . import __version__
+from .cache import get_cache
 from .extractor import CitationExtractor
 from .verifier import MultiSourceVerifier
 from .downloader import SmartPDFDownloader
@@ -29,6 +33,8 @@ from .models import Citation, VerifiedCitation
 
 console = Console()
 
+_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5})")
+
 
 @click.command()
 @click.argument("input_path")
@@ -105,16 +111,12 @@ def main(
       citeverify paper.pdf --threshold 0.6 --verbose
       citeverify paper.pdf --format bibtex > refs.bib
     """
-    from . import __version__
-    from .cache import VerificationCache
-
     console.print(f"[bold blue]CitationVerify v{__version__}[/bold blue]")
     console.print("━" * 60)
 
     # Handle cache clearing
     if clear_cache:
-        cache = VerificationCache()
-        count = cache.clear()
+        count = get_cache().clear()
         console.print(f"  Cleared {count} cache entries")
 
     # Validate threshold
@@ -158,9 +160,7 @@ def main(
 
         # Show cache stats in verbose mode
         if verbose and not no_cache:
-            from .cache import VerificationCache
-            cache = VerificationCache()
-            stats = cache.stats()
+            stats = get_cache().stats()
             console.print(f"\n  Cache: {stats['valid_entries']} entries")
 
         console.print(f"\n✨ Done in {result['duration']}")
@@ -188,7 +188,7 @@ async def run_pipeline(
 
     # Determine input type
     if input_path.startswith("http") and "arxiv.org" in input_path:
-        match = re.search(r"(\d{4}\.\d{4,5})", input_path)
+        match = _ARXIV_ID_RE.search(input_path)
         if not match:
             raise ValueError("Invalid arXiv URL")
         input_path = match.group(1)
@@ -205,6 +205,47 @@ async def run_pipeline(
             console.print(f"  [dim]{msg}[/dim]")
         verbose_logs.append(msg)
 
+    # One pooled session shared by verification and downloads, so
+    # keep-alive TCP/TLS connections to arxiv.org etc. are reused
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+    )
+    try:
+        return await _run_stages(
+            input_path=input_path,
+            input_type=input_type,
+            verify=verify,
+            download=download,
+            output_dir=output_dir,
+            verbose=verbose,
+            quality_min=quality_min,
+            threshold=threshold,
+            use_cache=use_cache,
+            session=session,
+            log_callback=log_callback,
+            verbose_logs=verbose_logs,
+            start_time=start_time,
+        )
+    finally:
+        await session.close()
+
+
+async def _run_stages(
+    input_path: str,
+    input_type: str,
+    verify: bool,
+    download: bool,
+    output_dir: str,
+    verbose: bool,
+    quality_min: int,
+    threshold: float,
+    use_cache: bool,
+    session: aiohttp.ClientSession,
+    log_callback,
+    verbose_logs: list,
+    start_time: float,
+) -> dict:
+    """Extraction, verification, scoring, and download stages."""
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -212,7 +253,7 @@ async def run_pipeline(
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
     ) as progress:
         extract_task = progress.add_task("Extracting citations...", total=100)
-        extractor = CitationExtractor()
+        extractor = CitationExtractor(use_cache=use_cache)
 
         if input_type == "pdf":
             citations, paper_title = extractor.extract_from_pdf(input_path)
@@ -238,12 +279,24 @@ async def run_pipeline(
                 use_cache=use_cache,
                 verbose=verbose,
                 log_callback=log_callback,
+                session=session,
             )
 
-            for citation in verified_citations:
-                result = await verifier.verify(citation)
-                citation.verification = result
-                progress.update(verify_task, advance=1)
+            # Verify concurrently, bounded so we don't hammer the APIs
+            # (per-source rate limits still apply inside the verifier)
+            semaphore = asyncio.Semaphore(8)
+
+            async def verify_one(citation):
+                async with semaphore:
+                    citation.verification = await verifier.verify(citation)
+                    progress.update(verify_task, advance=1)
+
+            # Batch cache writes into one transaction for the whole loop
+            cache_ctx = verifier.cache.bulk_writes() if verifier.cache else nullcontext()
+            with cache_ctx:
+                await asyncio.gather(
+                    *(verify_one(c) for c in verified_citations)
+                )
 
             await verifier.close()
 
@@ -278,7 +331,7 @@ async def run_pipeline(
                 "Downloading PDFs...",
                 total=len(verified_citations),
             )
-            downloader = SmartPDFDownloader()
+            downloader = SmartPDFDownloader(session=session)
 
             for citation in verified_citations:
                 if citation.verification:
@@ -16,8 +16,9 @@ load_dotenv()
 class SmartPDFDownloader:
     """Download PDFs with intelligent fallback."""
 
-    def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self.unpaywall_email = os.getenv("UNPAYWALL_EMAIL", "user@example.com")
 
     async def download(
@@ -73,36 +74,21 @@ class SmartPDFDownloader:
     async def _download_from_arxiv(
         self, arxiv_id: str, output_dir: str, citation_number: str
     ) -> PDFDownloadResult:
-        """Download from arXiv."""
-        try:
-            import arxiv
-
-            arxiv_id = normalize_arxiv_id(arxiv_id)
-            if not arxiv_id:
-                return PDFDownloadResult(success=False, error="Invalid arXiv ID")
-
-            search = arxiv.Search(id_list=[arxiv_id])
-            paper = next(search.results())
-
-            filename = f"[{citation_number}]_{arxiv_id}.pdf"
-            filepath = os.path.join(output_dir, filename)
-            paper.download_pdf(dirpath=output_dir, filename=filename)
-            file_size = os.path.getsize(filepath)
-
-            return PDFDownloadResult(
-                success=True,
-                pdf_path=filepath,
-                source="arxiv",
-                file_size=file_size,
-            )
-        except StopIteration:
-            return PDFDownloadResult(
-                success=False, error="arXiv paper not found"
-            )
-        except Exception as e:
-            return PDFDownloadResult(
-                success=False, error=f"arXiv download failed: {str(e)}"
-            )
+        """Download from arXiv via its stable PDF URL."""
+        arxiv_id = normalize_arxiv_id(arxiv_id)
+        if not arxiv_id:
+            return PDFDownloadResult(success=False, error="Invalid arXiv ID")
+
+        # Fetch the PDF directly over the shared session; the arxiv
+        # library's download_pdf is blocking and would stall the event
+        # loop for the whole transfer
+        url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+        result = await self._download_from_url(
+            url, output_dir, citation_number, "arxiv"
+        )
+        if not result.success and result.error:
+            result.error = f"arXiv download failed: {result.error}"
+        return result
 
     async def _download_from_unpaywall(
         self, doi: str, output_dir: str, citation_number: str
@@ -158,11 +144,15 @@ class SmartPDFDownloader:
                     return PDFDownloadResult(
                         success=False, error=f"HTTP {resp.status}"
                     )
-                content = await resp.read()
                 filename = f"[{citation_number}]_{source}.pdf"
                 filepath = os.path.join(output_dir, filename)
+                # Stream to disk in chunks instead of buffering the whole
+                # PDF in memory before writing
+                file_size = 0
                 with open(filepath, "wb") as f:
-                    f.write(content)
+                    async for chunk in resp.content.iter_chunked(1 << 16):
+                        f.write(chunk)
+                        file_size += len(chunk)
                 if not self._is_valid_pdf(filepath):
                     os.remove(filepath)
                     return PDFDownloadResult(
@@ -173,7 +163,7 @@ class SmartPDFDownloader:
                     success=True,
                     pdf_path=filepath,
                     source=source,
-                    file_size=len(content),
+                    file_size=file_size,
                 )
         except asyncio.TimeoutError:
             return PDFDownloadResult(
@@ -185,16 +175,24 @@ class SmartPDFDownloader:
             )
 
     def _is_valid_pdf(self, filepath: str) -> bool:
-        """Check if file is a valid PDF."""
+        """
+        Check if file is a valid PDF by its magic bytes.
+
+        A header of %PDF- plus an %%EOF marker near the end is enough to
+        reject HTML error pages; a full parse just to discard the result
+        costs tens of ms per download.
+        """
         try:
-            import PyPDF2
             with open(filepath, "rb") as f:
-                PyPDF2.PdfReader(f)
-            return True
-        except Exception:
+                if f.read(5) != b"%PDF-":
+                    return False
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 1024))
+                return b"%%EOF" in f.read()
+        except OSError:
             return False
 
     async def close(self):
-        """Close session."""
-        if self.session:
+        """Close session (only if this downloader created it)."""
+        if self.session and self._owns_session:
             await self.session.close()
@@ -1,69 +1,119 @@
 """Output formatters for CitationVerify."""
 
-import json
 import re
+import sys
 from typing import List
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from .models import VerifiedCitation, VerificationStatus
 
+# Serializes the whole list in one pass in pydantic-core, skipping the
+# per-citation model_dump() dict tree and the stdlib json re-walk
+_CITATIONS_ADAPTER = TypeAdapter(List[VerifiedCitation])
+
 console = Console()
 
+# Hot loops compare against these once per citation; module locals skip
+# the enum-class attribute load each time
+_VERIFIED = VerificationStatus.VERIFIED
+_PARTIAL = VerificationStatus.PARTIAL
+_UNVERIFIED = VerificationStatus.UNVERIFIED
+
 
 def display_summary(citations: List[VerifiedCitation]) -> None:
     """Display summary statistics."""
     total = len(citations)
     if total == 0:
-        console.print("\n[bold]SUMMARY[/bold]")
-        console.print("━" * 60)
-        console.print("No citations to display.")
+        console.print("\n[bold]SUMMARY[/bold]\n" + "━" * 60 + "\nNo citations to display.")
         return
 
-    verified = sum(
-        1
-        for c in citations
-        if c.verification
-        and c.verification.status == VerificationStatus.VERIFIED
-    )
-    partial = sum(
-        1
-        for c in citations
-        if c.verification
-        and c.verification.status == VerificationStatus.PARTIAL
-    )
-    unverified = sum(
-        1
-        for c in citations
-        if c.verification
-        and c.verification.status == VerificationStatus.UNVERIFIED
-    )
+    verified, partial, unverified, quality_total, pdfs_available = _stats(citations)
+    avg_quality = quality_total / total
 
-    avg_quality = (
-        sum(c.quality_score.total for c in citations if c.quality_score)
-        / total
-        if total > 0
-        else 0
-    )
-    pdfs_available = sum(
-        1 for c in citations if c.pdf_download and c.pdf_download.success
-    )
-
-    console.print("\n[bold]SUMMARY[/bold]")
-    console.print("━" * 60)
-    console.print(f"Total Citations:        {total}")
-    console.print(f"Verified:              {verified} ({verified * 100 // total}%)")
-    console.print(f"Partial Match:         {partial} ({partial * 100 // total}%)")
-    console.print(f"Unverified:            {unverified} ({unverified * 100 // total}%)")
-    console.print(f"\nOverall Quality:        {int(avg_quality)}/100")
+    # One print so Rich renders and flushes the summary block once
     console.print(
-        f"\nPDFs Available:         {pdfs_available}/{total} "
-        f"({pdfs_available * 100 // total}%)"
+        "\n".join(
+            (
+                "\n[bold]SUMMARY[/bold]",
+                "━" * 60,
+                f"Total Citations:        {total}",
+                f"Verified:              {verified} ({verified * 100 // total}%)",
+                f"Partial Match:         {partial} ({partial * 100 // total}%)",
+                f"Unverified:            {unverified} ({unverified * 100 // total}%)",
+                f"\nOverall Quality:        {int(avg_quality)}/100",
+                f"\nPDFs Available:         {pdfs_available}/{total} "
+                f"({pdfs_available * 100 // total}%)",
+            )
+        )
     )
 
 
+def _stats(citations: List[VerifiedCitation]):
+    """
+    Accumulate all summary counters in one pass.
+
+    Returns (verified, partial, unverified, quality_total, pdfs_available);
+    a single loop with local accumulators instead of five generator sweeps.
+    """
+    verified = partial = unverified = pdfs_available = 0
+    quality_total = 0.0
+    for c in citations:
+        v = c.verification
+        if v is not None:
+            if v.status is _VERIFIED:
+                verified += 1
+            elif v.status is _PARTIAL:
+                partial += 1
+            elif v.status is _UNVERIFIED:
+                unverified += 1
+        if c.quality_score is not None:
+            quality_total += c.quality_score.total
+        if c.pdf_download is not None and c.pdf_download.success:
+            pdfs_available += 1
+    return verified, partial, unverified, quality_total, pdfs_available
+
+
+# Past this row count Rich's per-cell measure/style pass dominates, so the
+# table falls back to plain fixed-width output
+_PLAIN_TABLE_THRESHOLD = 500
+
+_PLAIN_STATUS_CELLS = {
+    _VERIFIED: "Valid",
+    _PARTIAL: "Partial",
+}
+
+
+def _display_table_plain(citations: List[VerifiedCitation]) -> None:
+    """Fixed-width citation table written straight to stdout."""
+    lines = [
+        "",
+        "CITATION DETAILS",
+        "━" * 60,
+        f"{'#':<4} {'Citation':<35} {'Status':<10} {'Score':<6} {'PDF':<4}",
+    ]
+    for citation in citations:
+        v = citation.verification
+        if v is not None:
+            status = _PLAIN_STATUS_CELLS.get(v.status, "Unverified")
+            title = v.matched_title
+        else:
+            status = "?"
+            title = citation.title
+        score = citation.quality_score.total if citation.quality_score else 0
+        pdf = "Yes" if citation.pdf_download and citation.pdf_download.success else "No"
+        title = title[:35] if title else citation.raw_text[:35]
+        lines.append(f"{citation.number:<4} {title:<35} {status:<10} {score:<6} {pdf:<4}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+
+
 def display_table(citations: List[VerifiedCitation]) -> None:
     """Display citations as rich table."""
+    if len(citations) > _PLAIN_TABLE_THRESHOLD:
+        _display_table_plain(citations)
+        return
+
     console.print("\n[bold]CITATION DETAILS[/bold]")
     console.print("━" * 60)
 
@@ -74,58 +124,68 @@ def display_table(citations: List[VerifiedCitation]) -> None:
     table.add_column("Score", width=6)
     table.add_column("PDF", width=4)
 
+    # Resolve the per-row fields up front so the add_row loop is branch-free
+    for row in _citation_rows(citations):
+        table.add_row(*row)
+
+    console.print(table)
+
+
+_STATUS_CELLS = {
+    _VERIFIED: "[green]Valid[/green]",
+    _PARTIAL: "[yellow]Partial[/yellow]",
+}
+
+
+def _citation_rows(citations: List[VerifiedCitation]):
+    """Yield (number, title, status, score, pdf) display tuples."""
     for citation in citations:
-        status_str = "?"
-        if citation.verification:
-            if citation.verification.status == VerificationStatus.VERIFIED:
-                status_str = "[green]Valid[/green]"
-            elif citation.verification.status == VerificationStatus.PARTIAL:
-                status_str = "[yellow]Partial[/yellow]"
-            else:
-                status_str = "[red]Unverified[/red]"
+        v = citation.verification
+        if v is not None:
+            status_str = _STATUS_CELLS.get(v.status, "[red]Unverified[/red]")
+            title = v.matched_title
+        else:
+            status_str = "?"
+            title = citation.title
 
         score = citation.quality_score.total if citation.quality_score else 0
         pdf = "Yes" if citation.pdf_download and citation.pdf_download.success else "No"
-
-        title = (
-            citation.verification.matched_title
-            if citation.verification
-            else citation.title
-        )
         title = title[:35] if title else citation.raw_text[:35]
 
-        table.add_row(
-            citation.number,
-            title,
-            status_str,
-            str(score),
-            pdf,
-        )
-
-    console.print(table)
+        yield citation.number, title, status_str, str(score), pdf
 
 
 def display_json(citations: List[VerifiedCitation]) -> None:
     """Display as JSON."""
-    output = {"citations": [c.model_dump() for c in citations]}
-    print(json.dumps(output, indent=2, default=str))
+    out = sys.stdout.buffer
+    out.write(b'{"citations": ')
+    out.write(_CITATIONS_ADAPTER.dump_json(citations, indent=2))
+    out.write(b'}\n')
+    out.flush()
 
 
 def display_markdown(
     citations: List[VerifiedCitation], paper_title: str
 ) -> None:
     """Display as markdown."""
-    md = "# Citation Verification Report\n\n"
-    md += f"**Paper:** {paper_title}\n\n"
-    md += "## Citations\n\n"
-    md += "| # | Citation | Status | Score | PDF |\n"
-    md += "|---|----------|--------|-------|-----|\n"
+    # Accumulate lines and join once; += on a str re-copies the report
+    # for every row
+    lines = [
+        "# Citation Verification Report",
+        "",
+        f"**Paper:** {paper_title}",
+        "",
+        "## Citations",
+        "",
+        "| # | Citation | Status | Score | PDF |",
+        "|---|----------|--------|-------|-----|",
+    ]
 
     for citation in citations:
         status = (
             "Verified"
             if citation.verification
-            and citation.verification.status == VerificationStatus.VERIFIED
+            and citation.verification.status is _VERIFIED
             else "?"
         )
         score = citation.quality_score.total if citation.quality_score else 0
@@ -136,9 +196,10 @@ def display_markdown(
             else citation.title
             or citation.raw_text[:40]
         )
-        md += f"| {citation.number} | {title} | {status} | {score} | {pdf} |\n"
+        lines.append(f"| {citation.number} | {title} | {status} | {score} | {pdf} |")
 
-    print(md)
+    lines.append("")
+    print("\n".join(lines))
 
 
 def display_bibtex(
@@ -165,44 +226,64 @@ def display_bibtex(
     print("\n".join(bibtex_entries))
 
 
+# Rendered entries keyed by their identifying fields: exporting BibTeX to
+# a file and to stdout in the same session renders each entry once
+_BIBTEX_CACHE: dict = {}
+
+
 def _citation_to_bibtex(citation: VerifiedCitation) -> str:
     """
     Convert a single citation to BibTeX format.
-    
+
     Returns empty string if citation cannot be converted.
     """
     # Only export verified citations
     if not citation.verification:
         return ""
-    
+
     v = citation.verification
-    
+
     # Skip unverified
-    if v.status == VerificationStatus.UNVERIFIED:
+    if v.status is _UNVERIFIED:
         return ""
-    
-    # Generate citation key
-    key = _generate_bibtex_key(citation)
-    
+
+    # Only identified citations are cached; unidentified ones could
+    # collide on an all-None key
+    cache_key = None
+    if v.doi or v.arxiv_id:
+        cache_key = (
+            citation.number,
+            v.doi,
+            v.arxiv_id,
+            v.matched_title,
+            tuple(v.matched_authors or ()),
+            v.matched_year,
+        )
+        cached = _BIBTEX_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Resolve matched-vs-extracted fields once; the key generator reuses
+    # the same merged values instead of redoing the or-chains
+    title = v.matched_title or citation.title
+    authors = v.matched_authors or citation.authors
+    year = v.matched_year or citation.year
+
+    key = _generate_bibtex_key(citation, authors, year)
+
     # Determine entry type
     entry_type = _determine_entry_type(v)
     
     # Build fields
     fields = []
     
-    # Title
-    title = v.matched_title or citation.title
     if title:
         fields.append(f"  title = {{{title}}}")
     
-    # Authors
-    authors = v.matched_authors or citation.authors
     if authors:
         author_str = " and ".join(authors)
         fields.append(f"  author = {{{author_str}}}")
     
-    # Year
-    year = v.matched_year or citation.year
     if year:
         fields.append(f"  year = {{{year}}}")
     
@@ -237,21 +318,21 @@ def _citation_to_bibtex(citation: VerifiedCitation) -> str:
     if not fields:
         return ""
     
-    entry = f"@{entry_type}{{{key},\n"
-    entry += ",\n".join(fields)
-    entry += "\n}"
-    
+    entry = f"@{entry_type}{{{key},\n" + ",\n".join(fields) + "\n}"
+
+    if cache_key is not None:
+        if len(_BIBTEX_CACHE) > 4096:
+            _BIBTEX_CACHE.clear()
+        _BIBTEX_CACHE[cache_key] = entry
+
     return entry
 
 
-def _generate_bibtex_key(citation: VerifiedCitation) -> str:
-    """Generate a BibTeX citation key."""
-    v = citation.verification
-    
+def _generate_bibtex_key(citation: VerifiedCitation, authors, year) -> str:
+    """Generate a BibTeX citation key from pre-merged authors/year."""
     # Try to use author last name + year
     key_parts = []
     
-    authors = (v.matched_authors if v else None) or citation.authors
     if authors and authors[0]:
         # Extract last name (last word of first author)
         first_author = authors[0].strip()
@@ -262,7 +343,6 @@ def _generate_bibtex_key(citation: VerifiedCitation) -> str:
     else:
         key_parts.append("citation")
     
-    year = (v.matched_year if v else None) or citation.year
     if year:
         key_parts.append(str(year))
     
@@ -272,25 +352,25 @@ def _generate_bibtex_key(citation: VerifiedCitation) -> str:
     return "".join(key_parts)
 
 
+_PUB_TYPE_MAP = {
+    "journal-article": "article",
+    "proceedings-article": "inproceedings",
+    "paper-conference": "inproceedings",
+    "book-chapter": "incollection",
+    "book": "book",
+    "posted-content": "misc",  # Preprints
+    "thesis": "phdthesis",
+}
+
+
 def _determine_entry_type(v) -> str:
     """Determine BibTeX entry type from verification metadata."""
     metadata = v.metadata or {}
-    pub_type = metadata.get("type", "")
-    
-    if pub_type == "journal-article":
-        return "article"
-    elif pub_type in ["proceedings-article", "paper-conference"]:
-        return "inproceedings"
-    elif pub_type == "book-chapter":
-        return "incollection"
-    elif pub_type == "book":
-        return "book"
-    elif pub_type == "posted-content" or v.arxiv_id:
-        return "misc"  # Preprints
-    elif pub_type == "thesis":
-        return "phdthesis"
-    else:
+    entry_type = _PUB_TYPE_MAP.get(metadata.get("type", ""), "misc")
+    if entry_type == "phdthesis" and v.arxiv_id:
+        # Matches the old branch order: a preprint copy won over thesis
         return "misc"
+    return entry_type
 
 
 def save_bibtex(citations: List[VerifiedCitation], output_path: str) -> int:
@@ -304,16 +384,25 @@ def save_bibtex(citations: List[VerifiedCitation], output_path: str) -> int:
     Returns:
         Number of citations exported
     """
-    bibtex_entries = []
-    
-    for citation in citations:
-        entry = _citation_to_bibtex(citation)
-        if entry:
-            bibtex_entries.append(entry)
-    
+    # Stream entries to the (buffered) file handle instead of holding the
+    # whole export in memory; the header count is patched in afterwards
+    # since it isn't known until the entries are written
+    count = 0
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(f"% BibTeX export by CitationVerify\n")
-        f.write(f"% Verified citations: {len(bibtex_entries)}/{len(citations)}\n\n")
-        f.write("\n\n".join(bibtex_entries))
-    
-    return len(bibtex_entries)
+        header_pos = f.tell()
+        # Fixed-width placeholder so the count can be overwritten in place
+        # (count never needs more digits than the total)
+        width = len(str(len(citations)))
+        f.write(f"% Verified citations: {0:{width}d}/{len(citations)}\n\n")
+        for citation in citations:
+            entry = _citation_to_bibtex(citation)
+            if entry:
+                if count:
+                    f.write("\n\n")
+                f.write(entry)
+                count += 1
+        f.seek(header_pos)
+        f.write(f"% Verified citations: {count:{width}d}")
+
+    return count
@@ -1,55 +1,63 @@
 """Helper utility functions for CitationVerify."""
 
 import re
+from collections import deque
+from functools import lru_cache
 from typing import Optional
 
+# Compiled once at import; these run per citation, so pattern-string
+# re-parsing and re-cache lookups add up over a long bibliography
+# Fused hyphenated-line-break repair and whitespace collapse: one pass
+# over the title instead of one per rule (the first alternative joins
+# "im- age" -> "image", the second collapses any other whitespace run)
+_TITLE_CLEANUP_RE = re.compile(r'(\w+)-\s+(\w+)|\s+')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_NEW_ARXIV_ID_RE = re.compile(r'(\d{4}\.\d{4,5})')
+_PAGE_BEFORE_RE = re.compile(r'[:(]\s*$')
+_PAGE_AFTER_RE = re.compile(r'^[\s–\-]\s*\d')
+# Anchored prefix strips: one C-level sub replaces the startswith/slice
+# ladders, and handles the stacked "doi:https://doi.org/..." form too
+_DOI_PREFIX_RE = re.compile(r'^(?:doi:\s*)?(?:https?://doi\.org/)?', re.IGNORECASE)
+_ARXIV_PREFIX_RE = re.compile(r'^arxiv:\s*', re.IGNORECASE)
 
+# These helpers are pure functions of their string input, and papers in a
+# run (or corpus) repeat citations heavily, so memoizing turns repeat
+# normalizations into a dict hit
+
+
+@lru_cache(maxsize=4096)
 def normalize_doi(doi: str) -> Optional[str]:
     """Normalize DOI string."""
     if not doi:
         return None
     
-    # Remove common prefixes
-    doi = doi.strip()
-    if doi.startswith('doi:'):
-        doi = doi[4:].strip()
-    if doi.startswith('DOI:'):
-        doi = doi[4:].strip()
-    if doi.startswith('https://doi.org/'):
-        doi = doi[16:].strip()
-    if doi.startswith('http://doi.org/'):
-        doi = doi[15:].strip()
-    
-    # Remove trailing punctuation
-    doi = doi.rstrip('.,);:')
+    # Remove common prefixes and trailing punctuation
+    doi = _DOI_PREFIX_RE.sub('', doi.strip()).rstrip('.,);:')
     
     return doi if doi else None
 
 
+@lru_cache(maxsize=4096)
 def normalize_arxiv_id(arxiv_id: str) -> Optional[str]:
     """Normalize arXiv ID string."""
     if not arxiv_id:
         return None
     
-    arxiv_id = arxiv_id.strip()
-    
     # Remove common prefixes
-    if arxiv_id.startswith('arXiv:'):
-        arxiv_id = arxiv_id[6:].strip()
-    if arxiv_id.startswith('arxiv:'):
-        arxiv_id = arxiv_id[6:].strip()
+    arxiv_id = _ARXIV_PREFIX_RE.sub('', arxiv_id.strip())
     
     # Extract version if present (e.g., 1234.5678v1 -> 1234.5678)
-    match = re.match(r'(\d{4}\.\d{4,5})', arxiv_id)
+    match = _NEW_ARXIV_ID_RE.match(arxiv_id)
     if match:
         return match.group(1)
     
     return arxiv_id if arxiv_id else None
 
 
+@lru_cache(maxsize=4096)
 def extract_year_from_text(text: str) -> Optional[int]:
     """Extract publication year (4-digit) from text. Prefer year at end, skip page ranges like 1929–1958."""
-    matches = list(re.finditer(r'\b(19|20)\d{2}\b', text))
+    matches = list(_YEAR_RE.finditer(text))
     if not matches:
         return None
     # Prefer last year (publication year often at end); skip if in page range pattern like "15(1):1929–1958"
@@ -60,7 +68,7 @@ def extract_year_from_text(text: str) -> Optional[int]:
         before = text[max(0, start - 3) : start]
         after = text[end : end + 5] if end + 5 <= len(text) else ""
         # Skip if looks like page number: preceded by : and followed by – or - and digits
-        if re.search(r'[:(]\s*$', before) and re.match(r'^[\s–\-]\s*\d', after):
+        if _PAGE_BEFORE_RE.search(before) and _PAGE_AFTER_RE.match(after):
             continue
         return year
     return int(matches[-1].group(0))
@@ -78,22 +86,73 @@ _CONCATENATED_PHRASES = [
     ('suchas', 'such as'),
 ]
 
+# Common English words that might appear at word boundaries
+_COMMON_SUFFIXES = (
+    'ing', 'tion', 'sion', 'ment', 'ness', 'able', 'ible', 'ful', 'less',
+    'ous', 'ive', 'ary', 'ory', 'ical', 'ally', 'ward', 'wise', 'like',
+)
+_COMMON_PREFIXES = (
+    'un', 're', 'pre', 'dis', 'mis', 'non', 'over', 'under', 'sub', 'super',
+    'anti', 'auto', 'semi', 'multi', 'trans', 'inter', 'intra',
+)
+
+# Common short words that often get concatenated
+_COMMON_WORDS = frozenset({
+    'the', 'and', 'for', 'with', 'from', 'that', 'this', 'which', 'into',
+    'over', 'under', 'about', 'after', 'before', 'between', 'through',
+    'neural', 'network', 'networks', 'learning', 'learn', 'learns', 'deep',
+    'machine', 'machines', 'model', 'models', 'attention', 'transformer',
+    'language', 'natural', 'processing', 'sequence', 'sequences',
+    'recurrent', 'convolutional', 'training', 'translation', 'recognition',
+    'generation', 'classification', 'grammars', 'grammar', 'parsing',
+    'semantic', 'syntactic', 'encoder', 'decoder', 'embedding', 'embeddings',
+    'representation', 'representations', 'algorithms', 'algorithm', 'gpus',
+    'gpu', 'limits', 'exploring', 'international', 'conference',
+    'active', 'memory', 'replace', 'overfitting',
+})
+
+# Split candidates in the order the word scan probes them: longest first
+# (secondary alphabetical sort keeps ties deterministic), minimum length 3.
+# Sorting here once replaces a sort per word per call.
+_SPLIT_CANDIDATES = tuple(
+    sorted(
+        (w for w in _COMMON_WORDS if len(w) >= 3),
+        key=lambda w: (-len(w), w),
+    )
+)
+
+# Dictionary pre-filter: one alternation scan decides whether a word can
+# contain any split candidate at all, so the longest-first candidate loop
+# only runs for words that will actually match
+_ANY_CANDIDATE_RE = re.compile('|'.join(re.escape(w) for w in _SPLIT_CANDIDATES))
+
+# One alternation scan over the title instead of one sub() per phrase
+_CONCAT_FIXES = dict(_CONCATENATED_PHRASES)
+_CONCAT_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(bad) for bad, _ in _CONCATENATED_PHRASES) + r')\b',
+    re.IGNORECASE,
+)
+
+
+def _title_cleanup(match: re.Match) -> str:
+    """Replacement for _TITLE_CLEANUP_RE: rejoin a hyphen break or collapse whitespace."""
+    before = match.group(1)
+    return before + match.group(2) if before else ' '
 
+
+@lru_cache(maxsize=4096)
 def clean_title(title: str) -> str:
     """Clean and normalize title text."""
     if not title:
         return ""
     
-    # Fix hyphenated line breaks (e.g., "im- age" -> "image")
-    title = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', title)
-    
-    # Remove extra whitespace
-    title = re.sub(r'\s+', ' ', title)
+    # Fix hyphenated line breaks (e.g., "im- age" -> "image") and
+    # collapse extra whitespace in the same scan
+    title = _TITLE_CLEANUP_RE.sub(_title_cleanup, title)
     
     # Fix common short phrase concatenations (space dropped in PDFs)
     # e.g. "Grammar asa foreign language" -> "Grammar as a foreign language"
-    for bad, good in _CONCATENATED_PHRASES:
-        title = re.sub(r'\b' + re.escape(bad) + r'\b', good, title, flags=re.IGNORECASE)
+    title = _CONCAT_RE.sub(lambda m: _CONCAT_FIXES[m.group(1).lower()], title)
     
     # Fix concatenated words from PDF extraction
     # This handles cases like "networkgrammars" -> "network grammars"
@@ -115,67 +174,50 @@ def fix_concatenated_words(text: str) -> str:
     if not text:
         return text
     
-    words = text.split()
+    # Explicit worklist instead of recursion: split halves go back on the
+    # front of the queue (left half first), which preserves the original
+    # left-to-right output order without re-entering the call machinery
+    queue = deque(text.split())
     fixed_words = []
-    
-    # Common English words that might appear at word boundaries
-    common_suffixes = [
-        'ing', 'tion', 'sion', 'ment', 'ness', 'able', 'ible', 'ful', 'less',
-        'ous', 'ive', 'ary', 'ory', 'ical', 'ally', 'ward', 'wise', 'like'
-    ]
-    common_prefixes = [
-        'un', 're', 'pre', 'dis', 'mis', 'non', 'over', 'under', 'sub', 'super',
-        'anti', 'auto', 'semi', 'multi', 'trans', 'inter', 'intra'
-    ]
-    
-    # Common short words that often get concatenated
-    common_words = {
-        'the', 'and', 'for', 'with', 'from', 'that', 'this', 'which', 'into',
-        'over', 'under', 'about', 'after', 'before', 'between', 'through',
-        'neural', 'network', 'networks', 'learning', 'learn', 'learns', 'deep',
-        'machine', 'machines', 'model', 'models', 'attention', 'transformer',
-        'language', 'natural', 'processing', 'sequence', 'sequences',
-        'recurrent', 'convolutional', 'training', 'translation', 'recognition',
-        'generation', 'classification', 'grammars', 'grammar', 'parsing',
-        'semantic', 'syntactic', 'encoder', 'decoder', 'embedding', 'embeddings',
-        'representation', 'representations', 'algorithms', 'algorithm', 'gpus',
-        'gpu', 'limits', 'exploring', 'international', 'conference',
-        'active', 'memory', 'replace', 'overfitting',
-    }
-
-    for word in words:
+
+    while queue:
+        word = queue.popleft()
         # Skip short words
         if len(word) <= 8:
             fixed_words.append(word)
             continue
         # Keep whole if already a valid compound (e.g. overfitting, not "over fitting")
-        if word.lower() in common_words:
+        if word.lower() in _COMMON_WORDS:
             fixed_words.append(word)
             continue
         # Process long words: lowercase for split logic, but also handle mixed-case
         word_lower = word.lower()
-        
+        # No candidate occurs anywhere in the word: skip the split loop
+        if _ANY_CANDIDATE_RE.search(word_lower) is None:
+            fixed_words.append(word)
+            continue
+
         # Try to find a split point
         split_found = False
-        
-        for common in sorted(common_words, key=len, reverse=True):
-            if len(common) >= 3 and common in word_lower:
-                idx = word_lower.find(common)
+
+        for common in _SPLIT_CANDIDATES:
+            idx = word_lower.find(common)
+            if idx != -1:
                 before = word[:idx]
                 after = word[idx:]
                 
                 if idx > 2 and len(after) > 3:
-                    if before.lower() in common_words or len(before) >= 3:
-                        # Recursively fix parts (handles multiple concatenations)
-                        fixed_words.extend(fix_concatenated_words(before).split())
-                        fixed_words.extend(fix_concatenated_words(after).split())
+                    if before.lower() in _COMMON_WORDS or len(before) >= 3:
+                        # Requeue both halves (handles multiple concatenations)
+                        queue.appendleft(after)
+                        queue.appendleft(before)
                         split_found = True
                         break
                 elif idx == 0 and len(after) > len(common) + 2:
                     remainder = word[len(common):]
-                    if remainder.lower() in common_words or len(remainder) >= 4:
-                        fixed_words.extend(fix_concatenated_words(word[:len(common)]).split())
-                        fixed_words.extend(fix_concatenated_words(remainder).split())
+                    if remainder.lower() in _COMMON_WORDS or len(remainder) >= 4:
+                        queue.appendleft(remainder)
+                        queue.appendleft(word[:len(common)])
                         split_found = True
                         break
         
@@ -2,12 +2,81 @@
 
 import asyncio
 import re
+import xml.etree.ElementTree as ET
 import aiohttp
+from functools import lru_cache
 from typing import Optional, List, Callable
 from difflib import SequenceMatcher
 from .models import Citation, VerificationResult, VerificationStatus
 from .utils import normalize_doi, normalize_arxiv_id, clean_title
-from .cache import VerificationCache
+# _loads is cache.py's orjson-when-available JSON parser; API payloads
+# are parsed with it instead of aiohttp's stdlib-json resp.json()
+from .cache import get_cache, _loads
+
+# Compiled once at import: _title_similarity runs per candidate per source,
+# so per-call pattern-cache lookups add up across a bibliography
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5})")
+
+# arXiv is queried directly over the shared aiohttp session (the arxiv
+# package is a blocking client and would stall the event loop)
+_ARXIV_API_URL = "http://export.arxiv.org/api/query"
+_ATOM_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+
+
+def _parse_arxiv_feed(body: str) -> List[dict]:
+    """Parse an arXiv Atom API response into plain entry dicts."""
+    entries = []
+    for entry in ET.fromstring(body).findall("atom:entry", _ATOM_NS):
+        pdf_url = None
+        for link in entry.findall("atom:link", _ATOM_NS):
+            if link.get("title") == "pdf":
+                pdf_url = link.get("href")
+                break
+        published = entry.findtext("atom:published", "", _ATOM_NS)
+        entries.append({
+            "id": entry.findtext("atom:id", "", _ATOM_NS),
+            # Titles come back with feed line breaks; collapse like the
+            # rest of the pipeline expects
+            "title": _WS_RE.sub(" ", entry.findtext("atom:title", "", _ATOM_NS)).strip(),
+            "authors": [
+                a.findtext("atom:name", "", _ATOM_NS)
+                for a in entry.findall("atom:author", _ATOM_NS)
+            ],
+            "year": int(published[:4]) if published[:4].isdigit() else None,
+            "doi": entry.findtext("arxiv:doi", None, _ATOM_NS),
+            "summary": entry.findtext("atom:summary", "", _ATOM_NS).strip(),
+            "pdf_url": pdf_url,
+        })
+    return entries
+
+
+try:
+    # rapidfuzz computes the ratio in C++ and is an order of magnitude
+    # faster than difflib on title-length strings; difflib remains the
+    # fallback so rapidfuzz stays an optional accelerator
+    from rapidfuzz.fuzz import ratio as _rf_ratio
+
+    def _ratio(t1: str, t2: str) -> float:
+        return _rf_ratio(t1, t2) / 100.0
+except ImportError:
+    def _ratio(t1: str, t2: str) -> float:
+        return SequenceMatcher(None, t1, t2).ratio()
+
+
+@lru_cache(maxsize=2048)
+def _norm_title(title: str) -> str:
+    """Normalize a title for comparison: collapse whitespace, strip punctuation, lowercase.
+
+    Memoized because ranking candidates re-normalizes the citation's own
+    title once per candidate per source.
+    """
+    title = _WS_RE.sub(" ", str(title).strip())
+    return _PUNCT_RE.sub("", title.lower())
 
 
 class MultiSourceVerifier:
@@ -19,6 +88,7 @@ class MultiSourceVerifier:
         use_cache: bool = True,
         verbose: bool = False,
         log_callback: Callable[[str], None] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize verifier.
@@ -28,8 +98,13 @@ class MultiSourceVerifier:
             use_cache: Whether to use caching for API results
             verbose: Whether to log detailed verification attempts
             log_callback: Function to call for logging (receives log message)
+            session: Shared aiohttp session; one is created lazily if omitted
         """
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        # One timeout object for every request instead of a fresh
+        # ClientTimeout construction per call
+        self._timeout = aiohttp.ClientTimeout(total=10)
         self.threshold = threshold
         self.use_cache = use_cache
         self.verbose = verbose
@@ -41,7 +116,7 @@ class MultiSourceVerifier:
         }
 
         if use_cache:
-            self.cache = VerificationCache()
+            self.cache = get_cache()
         else:
             self.cache = None
 
@@ -60,11 +135,25 @@ class MultiSourceVerifier:
         3. Fuzzy search across all sources
         """
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            # Same pooling the CLI configures for its shared session:
+            # keep-alive connections to the handful of API hosts are
+            # reused across every citation in the run
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=16,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                )
+            )
 
         self._log(f"[{citation.number}] Starting verification...")
 
-        # Priority 1: DOI lookup
+        # Priorities 1-2: identifier lookups. DOI (CrossRef) outranks
+        # arXiv, but when a citation carries both identifiers the two
+        # lookups run concurrently so the DOI round trip doesn't serialize
+        # in front of the arXiv one it usually masks.
+        doi_task = None
         if citation.doi:
             self._log(f"[{citation.number}] Trying DOI: {citation.doi}")
 
@@ -75,30 +164,48 @@ class MultiSourceVerifier:
                     self._log(f"[{citation.number}] Found in cache (DOI)")
                     return cached
 
-            result = await self._verify_via_crossref_doi(citation.doi)
+            doi_task = asyncio.create_task(
+                self._verify_via_crossref_doi(citation.doi)
+            )
+
+        arxiv_task = None
+        arxiv_cached = None
+        if citation.arxiv_id:
+            self._log(f"[{citation.number}] Trying arXiv ID: {citation.arxiv_id}")
+
+            # Check cache first
+            if self.cache:
+                arxiv_cached = self.cache.get("arxiv", citation.arxiv_id)
+                if arxiv_cached and doi_task is None:
+                    self._log(f"[{citation.number}] Found in cache (arXiv)")
+                    return arxiv_cached
+
+            if arxiv_cached is None:
+                arxiv_task = asyncio.create_task(
+                    self._verify_via_arxiv(citation.arxiv_id)
+                )
+
+        if doi_task is not None:
+            result = await doi_task
 
             if result.status == VerificationStatus.VERIFIED:
                 self._log(f"[{citation.number}] Verified via CrossRef DOI")
                 if self.cache:
                     self.cache.set("doi", citation.doi, result)
+                if arxiv_task is not None:
+                    arxiv_task.cancel()
                 return result
             else:
                 self._log(
                     f"[{citation.number}] DOI lookup failed: {result.discrepancies}"
                 )
 
-        # Priority 2: arXiv ID lookup
-        if citation.arxiv_id:
-            self._log(f"[{citation.number}] Trying arXiv ID: {citation.arxiv_id}")
-
-            # Check cache first
-            if self.cache:
-                cached = self.cache.get("arxiv", citation.arxiv_id)
-                if cached:
-                    self._log(f"[{citation.number}] Found in cache (arXiv)")
-                    return cached
+        if arxiv_cached is not None:
+            self._log(f"[{citation.number}] Found in cache (arXiv)")
+            return arxiv_cached
 
-            result = await self._verify_via_arxiv(citation.arxiv_id)
+        if arxiv_task is not None:
+            result = await arxiv_task
 
             if result.status == VerificationStatus.VERIFIED:
                 self._log(f"[{citation.number}] Verified via arXiv")
@@ -251,6 +358,35 @@ class MultiSourceVerifier:
             discrepancies=reasons,
         )
 
+    async def _cached_get_json(self, url: str, params: dict) -> Optional[dict]:
+        """
+        GET a JSON endpoint, caching successful payloads by URL + params.
+
+        Re-verifying the same bibliography repeats identical search queries;
+        caching at the request level means those land in SQLite instead of
+        on the network. Non-200 responses return None and are not cached.
+        """
+        cache_value = url + "?" + "&".join(
+            f"{k}={params[k]}" for k in sorted(params)
+        )
+
+        if self.cache:
+            cached = self.cache.get_payload("http", cache_value)
+            if cached is not None:
+                return cached
+
+        async with self.session.get(
+            url, params=params, timeout=self._timeout
+        ) as resp:
+            if resp.status != 200:
+                return None
+            data = _loads(await resp.read())
+
+        if self.cache:
+            self.cache.set_payload("http", cache_value, data)
+
+        return data
+
     async def _verify_via_crossref_doi(self, doi: str) -> VerificationResult:
         """Verify using CrossRef DOI lookup."""
         doi = normalize_doi(doi)
@@ -266,7 +402,7 @@ class MultiSourceVerifier:
 
             try:
                 async with self.session.get(
-                    url, timeout=aiohttp.ClientTimeout(total=10)
+                    url, timeout=self._timeout
                 ) as resp:
                     if resp.status == 404:
                         return VerificationResult(
@@ -282,7 +418,7 @@ class MultiSourceVerifier:
                             discrepancies=[f"CrossRef API error: {resp.status}"],
                         )
 
-                    data = await resp.json()
+                    data = _loads(await resp.read())
                     message = data["message"]
 
                     # Extract title
@@ -353,32 +489,44 @@ class MultiSourceVerifier:
 
         async with self.rate_limits["arxiv"]:
             try:
-                import arxiv
+                async with self.session.get(
+                    _ARXIV_API_URL,
+                    params={"id_list": arxiv_id, "max_results": 1},
+                    timeout=self._timeout,
+                ) as resp:
+                    if resp.status != 200:
+                        return VerificationResult(
+                            status=VerificationStatus.ERROR,
+                            confidence=0.0,
+                            discrepancies=[f"arXiv API error: {resp.status}"],
+                        )
+                    body = await resp.text()
 
-                search = arxiv.Search(id_list=[arxiv_id])
-                paper = next(search.results())
+                entries = _parse_arxiv_feed(body)
+                # Unknown IDs yield an empty feed or an api/errors entry
+                if not entries or "api/errors" in entries[0]["id"]:
+                    return VerificationResult(
+                        status=VerificationStatus.UNVERIFIED,
+                        confidence=0.0,
+                        discrepancies=["arXiv ID not found"],
+                    )
 
+                paper = entries[0]
                 return VerificationResult(
                     status=VerificationStatus.VERIFIED,
                     confidence=1.0,
-                    matched_title=paper.title,
-                    matched_authors=[a.name for a in paper.authors],
-                    matched_year=paper.published.year if paper.published else None,
-                    doi=paper.doi,
+                    matched_title=paper["title"],
+                    matched_authors=paper["authors"],
+                    matched_year=paper["year"],
+                    doi=paper["doi"],
                     arxiv_id=arxiv_id,
                     verified_sources=["arxiv"],
                     metadata={
-                        "abstract": paper.summary,
-                        "pdf_url": paper.pdf_url,
+                        "abstract": paper["summary"],
+                        "pdf_url": paper["pdf_url"],
                     },
                 )
 
-            except StopIteration:
-                return VerificationResult(
-                    status=VerificationStatus.UNVERIFIED,
-                    confidence=0.0,
-                    discrepancies=["arXiv ID not found"],
-                )
             except Exception as e:
                 return VerificationResult(
                     status=VerificationStatus.ERROR,
@@ -398,83 +546,78 @@ class MultiSourceVerifier:
             params = {"query": citation.title, "rows": 5}
 
             try:
-                async with self.session.get(
-                    url, params=params, timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status != 200:
-                        return None
+                data = await self._cached_get_json(url, params)
+                if data is None:
+                    return None
 
-                    data = await resp.json()
-                    items = data["message"].get("items", [])
+                items = data["message"].get("items", [])
 
-                    if not items:
-                        return None
+                if not items:
+                    return None
 
-                    # Find best title match
-                    best_match = max(
-                        items,
-                        key=lambda item: self._title_similarity(
-                            citation.title,
-                            (
-                                item["title"][0]
-                                if item.get("title")
-                                and isinstance(item["title"], list)
-                                else (item.get("title") or "")
-                            ),
-                        ),
+                # Find best title match in one pass, keeping the winning
+                # similarity instead of recomputing it after the scan
+                best_match = None
+                matched_title = ""
+                similarity = 0.0
+                for item in items:
+                    item_title = (
+                        item["title"][0]
+                        if item.get("title")
+                        and isinstance(item["title"], list)
+                        else (item.get("title") or "")
                     )
-
-                    matched_title = (
-                        best_match["title"][0]
-                        if best_match.get("title")
-                        and isinstance(best_match["title"], list)
-                        else (best_match.get("title") or "")
+                    item_similarity = self._title_similarity(
+                        citation.title, item_title
                     )
-                    similarity = self._title_similarity(citation.title, matched_title)
-
-                    if similarity < self.threshold:
-                        return None
+                    if item_similarity > similarity:
+                        similarity = item_similarity
+                        best_match = item
+                        matched_title = item_title
 
-                    status = (
-                        VerificationStatus.VERIFIED
-                        if similarity >= 0.75
-                        else VerificationStatus.PARTIAL
-                    )
+                if best_match is None or similarity < self.threshold:
+                    return None
 
-                    # Extract authors
-                    matched_authors = []
-                    if best_match.get("author"):
-                        matched_authors = [
-                            f"{a.get('given', '')} {a.get('family', '')}".strip()
-                            for a in best_match["author"]
-                        ]
+                status = (
+                    VerificationStatus.VERIFIED
+                    if similarity >= 0.75
+                    else VerificationStatus.PARTIAL
+                )
 
-                    # Extract year
-                    matched_year = None
-                    if best_match.get("published-print"):
-                        date_parts = best_match["published-print"].get(
-                            "date-parts", []
-                        )
-                        if date_parts and date_parts[0]:
-                            matched_year = date_parts[0][0]
-                    elif best_match.get("published-online"):
-                        date_parts = best_match["published-online"].get(
-                            "date-parts", []
-                        )
-                        if date_parts and date_parts[0]:
-                            matched_year = date_parts[0][0]
+                # Extract authors
+                matched_authors = []
+                if best_match.get("author"):
+                    matched_authors = [
+                        f"{a.get('given', '')} {a.get('family', '')}".strip()
+                        for a in best_match["author"]
+                    ]
 
-                    return VerificationResult(
-                        status=status,
-                        confidence=similarity,
-                        matched_title=matched_title,
-                        matched_authors=matched_authors,
-                        matched_year=matched_year,
-                        doi=best_match.get("DOI"),
-                        verified_sources=["crossref"],
-                        discrepancies=self._find_discrepancies(citation, best_match),
-                        metadata=best_match,
+                # Extract year
+                matched_year = None
+                if best_match.get("published-print"):
+                    date_parts = best_match["published-print"].get(
+                        "date-parts", []
+                    )
+                    if date_parts and date_parts[0]:
+                        matched_year = date_parts[0][0]
+                elif best_match.get("published-online"):
+                    date_parts = best_match["published-online"].get(
+                        "date-parts", []
                     )
+                    if date_parts and date_parts[0]:
+                        matched_year = date_parts[0][0]
+
+                return VerificationResult(
+                    status=status,
+                    confidence=similarity,
+                    matched_title=matched_title,
+                    matched_authors=matched_authors,
+                    matched_year=matched_year,
+                    doi=best_match.get("DOI"),
+                    verified_sources=["crossref"],
+                    discrepancies=self._find_discrepancies(citation, best_match),
+                    metadata=best_match,
+                )
 
             except Exception:
                 return None
@@ -494,57 +637,57 @@ class MultiSourceVerifier:
         }
 
         try:
-            async with self.session.get(
-                url, params=params, timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                if resp.status != 200:
-                    return None
+            data = await self._cached_get_json(url, params)
+            if data is None:
+                return None
 
-                data = await resp.json()
-                papers = data.get("data", [])
+            papers = data.get("data", [])
 
-                if not papers:
-                    return None
+            if not papers:
+                return None
 
-                # Find best match
-                best_match = max(
-                    papers,
-                    key=lambda p: self._title_similarity(
-                        citation.title, p.get("title", "")
-                    ),
+            # Find best match in one pass, keeping the winning similarity
+            best_match = None
+            matched_title = ""
+            similarity = 0.0
+            for paper in papers:
+                paper_title = paper.get("title", "")
+                paper_similarity = self._title_similarity(
+                    citation.title, paper_title
                 )
+                if paper_similarity > similarity:
+                    similarity = paper_similarity
+                    best_match = paper
+                    matched_title = paper_title
 
-                matched_title = best_match.get("title", "")
-                similarity = self._title_similarity(citation.title, matched_title)
-
-                if similarity < self.threshold:
-                    return None
+            if best_match is None or similarity < self.threshold:
+                return None
 
-                status = (
-                    VerificationStatus.VERIFIED
-                    if similarity > 0.8
-                    else VerificationStatus.PARTIAL
-                )
+            status = (
+                VerificationStatus.VERIFIED
+                if similarity > 0.8
+                else VerificationStatus.PARTIAL
+            )
 
-                # Extract arXiv ID if present
-                arxiv_id = None
-                external_ids = best_match.get("externalIds", {})
-                if external_ids and "ArXiv" in external_ids:
-                    arxiv_id = normalize_arxiv_id(external_ids["ArXiv"])
+            # Extract arXiv ID if present
+            arxiv_id = None
+            external_ids = best_match.get("externalIds", {})
+            if external_ids and "ArXiv" in external_ids:
+                arxiv_id = normalize_arxiv_id(external_ids["ArXiv"])
 
-                return VerificationResult(
-                    status=status,
-                    confidence=similarity,
-                    matched_title=matched_title,
-                    matched_authors=[
-                        a.get("name", "") for a in best_match.get("authors", [])
-                    ],
-                    matched_year=best_match.get("year"),
-                    doi=external_ids.get("DOI") if external_ids else None,
-                    arxiv_id=arxiv_id,
-                    verified_sources=["semantic_scholar"],
-                    metadata=best_match,
-                )
+            return VerificationResult(
+                status=status,
+                confidence=similarity,
+                matched_title=matched_title,
+                matched_authors=[
+                    a.get("name", "") for a in best_match.get("authors", [])
+                ],
+                matched_year=best_match.get("year"),
+                doi=external_ids.get("DOI") if external_ids else None,
+                arxiv_id=arxiv_id,
+                verified_sources=["semantic_scholar"],
+                metadata=best_match,
+            )
 
         except Exception:
             return None
@@ -556,8 +699,6 @@ class MultiSourceVerifier:
 
         async with self.rate_limits["arxiv"]:
             try:
-                import arxiv
-
                 # Strip leading article - "A decomposable attention..." returns different arXiv results than "decomposable attention..."
                 query = citation.title.strip()
                 for prefix in ("A ", "An ", "The "):
@@ -566,20 +707,24 @@ class MultiSourceVerifier:
                         break
 
                 # Search arXiv by title (fetch more to find papers that rank lower in relevance)
-                search = arxiv.Search(
-                    query=query,
-                    max_results=25,
-                    sort_by=arxiv.SortCriterion.Relevance,
-                )
-                # Use Client.results() - search.results() is deprecated and may be broken
-                client = arxiv.Client()
-                results_iter = client.results(search)
+                async with self.session.get(
+                    _ARXIV_API_URL,
+                    params={
+                        "search_query": query,
+                        "max_results": 25,
+                        "sortBy": "relevance",
+                    },
+                    timeout=self._timeout,
+                ) as resp:
+                    if resp.status != 200:
+                        return None
+                    body = await resp.text()
 
                 best_match = None
                 best_similarity = 0.0
 
-                for paper in results_iter:
-                    similarity = self._title_similarity(citation.title, paper.title)
+                for paper in _parse_arxiv_feed(body):
+                    similarity = self._title_similarity(citation.title, paper["title"])
                     if similarity > best_similarity:
                         best_similarity = similarity
                         best_match = paper
@@ -590,26 +735,24 @@ class MultiSourceVerifier:
                 # arXiv match by title is authoritative: treat as VERIFIED when above threshold
                 status = VerificationStatus.VERIFIED
 
-                # Extract arXiv ID from entry_id (e.g., "http://arxiv.org/abs/1234.56789v1")
+                # Extract arXiv ID from the entry id (e.g., "http://arxiv.org/abs/1234.56789v1")
                 arxiv_id = None
-                if best_match.entry_id:
-                    import re
-                    match = re.search(r'(\d{4}\.\d{4,5})', best_match.entry_id)
-                    if match:
-                        arxiv_id = match.group(1)
+                match = _ARXIV_ID_RE.search(best_match["id"])
+                if match:
+                    arxiv_id = match.group(1)
 
                 return VerificationResult(
                     status=status,
                     confidence=best_similarity,
-                    matched_title=best_match.title,
-                    matched_authors=[a.name for a in best_match.authors],
-                    matched_year=best_match.published.year if best_match.published else None,
-                    doi=best_match.doi,
+                    matched_title=best_match["title"],
+                    matched_authors=best_match["authors"],
+                    matched_year=best_match["year"],
+                    doi=best_match["doi"],
                     arxiv_id=arxiv_id,
                     verified_sources=["arxiv"],
                     metadata={
-                        "abstract": best_match.summary,
-                        "pdf_url": best_match.pdf_url,
+                        "abstract": best_match["summary"],
+                        "pdf_url": best_match["pdf_url"],
                     },
                 )
 
@@ -629,83 +772,81 @@ class MultiSourceVerifier:
             }
 
             try:
-                async with self.session.get(
-                    url, params=params, timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status != 200:
-                        return None
+                data = await self._cached_get_json(url, params)
+                if data is None:
+                    return None
 
-                    data = await resp.json()
-                    results = data.get("results", [])
+                results = data.get("results", [])
 
-                    if not results:
-                        return None
+                if not results:
+                    return None
 
-                    best_match = max(
-                        results,
-                        key=lambda w: self._title_similarity(
-                            citation.title,
-                            w.get("title") or w.get("display_name", ""),
-                        ),
+                # One pass over the works, keeping the winning similarity
+                best_match = None
+                matched_title = ""
+                similarity = 0.0
+                for work in results:
+                    work_title = work.get("title") or work.get("display_name", "")
+                    work_similarity = self._title_similarity(
+                        citation.title, work_title
                     )
+                    if work_similarity > similarity:
+                        similarity = work_similarity
+                        best_match = work
+                        matched_title = work_title
 
-                    matched_title = (
-                        best_match.get("title") or best_match.get("display_name", "")
-                    )
-                    similarity = self._title_similarity(citation.title, matched_title)
+                if best_match is None or similarity < self.threshold:
+                    return None
 
-                    if similarity < self.threshold:
-                        return None
+                status = (
+                    VerificationStatus.VERIFIED
+                    if similarity >= 0.75
+                    else VerificationStatus.PARTIAL
+                )
 
-                    status = (
-                        VerificationStatus.VERIFIED
-                        if similarity >= 0.75
-                        else VerificationStatus.PARTIAL
-                    )
+                matched_authors = [
+                    a.get("author", {}).get("display_name", "")
+                    for a in best_match.get("authorships", [])
+                ]
+                matched_year = best_match.get("publication_year")
 
-                    matched_authors = [
-                        a.get("author", {}).get("display_name", "")
-                        for a in best_match.get("authorships", [])
-                    ]
-                    matched_year = best_match.get("publication_year")
-
-                    doi = None
-                    ids = best_match.get("ids", {}) or {}
-                    if ids.get("doi"):
-                        doi_raw = ids["doi"]
-                        if isinstance(doi_raw, str) and "doi.org/" in doi_raw:
-                            doi = doi_raw.split("doi.org/")[-1]
-                        else:
-                            doi = str(doi_raw)
-
-                    arxiv_id = None
-                    for loc in best_match.get("locations", []) or []:
-                        loc_id = loc.get("id", "")
-                        arxiv_match = re.search(
-                            r"arxiv\.org[:\s]*(\d{4}\.\d{4,5})|arxiv\.(\d{4}\.\d{4,5})",
-                            loc_id,
-                            re.IGNORECASE,
-                        )
-                        if arxiv_match:
-                            arxiv_id = arxiv_match.group(1) or arxiv_match.group(2)
-                            break
-                    if arxiv_id:
-                        arxiv_id = normalize_arxiv_id(arxiv_id)
+                doi = None
+                ids = best_match.get("ids", {}) or {}
+                if ids.get("doi"):
+                    doi_raw = ids["doi"]
+                    if isinstance(doi_raw, str) and "doi.org/" in doi_raw:
+                        doi = doi_raw.split("doi.org/")[-1]
+                    else:
+                        doi = str(doi_raw)
 
-                    return VerificationResult(
-                        status=status,
-                        confidence=similarity,
-                        matched_title=matched_title,
-                        matched_authors=matched_authors,
-                        matched_year=matched_year,
-                        doi=doi,
-                        arxiv_id=arxiv_id,
-                        verified_sources=["openalex"],
-                        metadata={
-                            "cited_by_count": best_match.get("cited_by_count"),
-                            "openalex_id": best_match.get("id"),
-                        },
+                arxiv_id = None
+                for loc in best_match.get("locations", []) or []:
+                    loc_id = loc.get("id", "")
+                    arxiv_match = re.search(
+                        r"arxiv\.org[:\s]*(\d{4}\.\d{4,5})|arxiv\.(\d{4}\.\d{4,5})",
+                        loc_id,
+                        re.IGNORECASE,
                     )
+                    if arxiv_match:
+                        arxiv_id = arxiv_match.group(1) or arxiv_match.group(2)
+                        break
+                if arxiv_id:
+                    arxiv_id = normalize_arxiv_id(arxiv_id)
+
+                return VerificationResult(
+                    status=status,
+                    confidence=similarity,
+                    matched_title=matched_title,
+                    matched_authors=matched_authors,
+                    matched_year=matched_year,
+                    doi=doi,
+                    arxiv_id=arxiv_id,
+                    verified_sources=["openalex"],
+                    metadata={
+                        "cited_by_count": best_match.get("cited_by_count"),
+                        "openalex_id": best_match.get("id"),
+                    },
+                )
 
             except Exception:
                 return None
@@ -726,17 +867,11 @@ class MultiSourceVerifier:
 
     def _title_similarity(self, title1: str, title2: str) -> float:
         """Calculate title similarity (0-1)."""
-        import re
-
         if not title1 or not title2:
             return 0.0
 
-        # Normalize whitespace (collapse newlines/spaces from PDFs)
-        title1 = re.sub(r"\s+", " ", str(title1).strip())
-        title2 = re.sub(r"\s+", " ", str(title2).strip())
-        # Remove punctuation and lowercase for comparison
-        t1 = re.sub(r"[^\w\s]", "", title1.lower())
-        t2 = re.sub(r"[^\w\s]", "", title2.lower())
+        t1 = _norm_title(title1)
+        t2 = _norm_title(title2)
         w1 = t1.split()
         w2 = t2.split()
 
@@ -748,7 +883,7 @@ class MultiSourceVerifier:
             if w2 == w1[: len(w2)]:
                 return 0.95
 
-        return SequenceMatcher(None, t1, t2).ratio()
+        return _ratio(t1, t2)
 
     def _find_discrepancies(self, original: Citation, matched: dict) -> list:
         """Find discrepancies between original and matched."""
@@ -781,6 +916,6 @@ class MultiSourceVerifier:
         return None
 
     async def close(self):
-        """Close session."""
-        if self.session:
+        """Close session (only if this verifier created it)."""
+        if self.session and self._owns_session:
             await self.session.close()
@@ -0,0 +1,77 @@
+"""Tests for the SQLite verification cache."""
+
+import pytest
+from citeverify.cache import VerificationCache
+from citeverify.models import VerificationResult, VerificationStatus
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache backed by a temporary directory."""
+    return VerificationCache(cache_dir=str(tmp_path))
+
+
+@pytest.fixture
+def sample_result():
+    """A verified result to store."""
+    return VerificationResult(
+        status=VerificationStatus.VERIFIED,
+        confidence=0.95,
+        matched_title="Attention Is All You Need",
+        matched_authors=["Ashish Vaswani"],
+        matched_year=2017,
+        doi="10.1234/test",
+        verified_sources=["crossref"],
+    )
+
+
+def test_set_get_roundtrip(cache, sample_result):
+    """Stored result comes back intact."""
+    cache.set("doi", "10.1234/test", sample_result)
+    result = cache.get("doi", "10.1234/test")
+    assert result is not None
+    assert result.status == VerificationStatus.VERIFIED
+    assert result.matched_title == "Attention Is All You Need"
+    assert result.confidence == 0.95
+
+
+def test_get_miss_returns_none(cache):
+    """Unknown key returns None."""
+    assert cache.get("doi", "10.9999/missing") is None
+
+
+def test_key_is_case_insensitive(cache, sample_result):
+    """Lookups normalize case and surrounding whitespace."""
+    cache.set("title", "Attention Is All You Need", sample_result)
+    assert cache.get("title", "  attention is all you need ") is not None
+
+
+def test_clear(cache, sample_result):
+    """Clear removes all entries and reports the count."""
+    cache.set("doi", "10.1234/a", sample_result)
+    cache.set("doi", "10.1234/b", sample_result)
+    assert cache.clear() == 2
+    assert cache.get("doi", "10.1234/a") is None
+
+
+def test_stats(cache, sample_result):
+    """Stats reflect stored entries by type."""
+    cache.set("doi", "10.1234/a", sample_result)
+    cache.set("title", "Some Title", sample_result)
+    stats = cache.stats()
+    assert stats["total_entries"] == 2
+    assert stats["valid_entries"] == 2
+    assert stats["by_type"].get("doi") == 1
+    assert stats["by_type"].get("title") == 1
+
+
+def test_in_memory_layer_hits_without_sqlite(cache, sample_result):
+    """Repeated lookups are served from the in-memory layer."""
+    cache.set("doi", "10.1234/test", sample_result)
+    first = cache.get("doi", "10.1234/test")
+    # Drop the table behind the cache's back; the memory layer still answers
+    cache._conn.execute("DELETE FROM verification_cache")
+    cache._conn.commit()
+    second = cache.get("doi", "10.1234/test")
+    assert first is not None and second is not None
+    assert second.matched_title == first.matched_title